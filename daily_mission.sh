@@ -18,8 +18,22 @@ ADB_EXEC="/opt/homebrew/bin/adb" # 或者 /opt/homebrew/bin/adb
 # export OPENAI_API_KEY="rrrrrzy"
 export GLM_KEY
 
+# 5. 任务前后需要结束的应用包名
+APP_PACKAGE="com.mihoyo.hyperion"
+
 # =======================================================
 
+# 任务前后的设备操作表：每个阶段的命令在一次 adb shell 中执行，只建立一次 adb 连接
+# 唤醒：电源键唤醒 -> 等待 -> 上滑解锁 (参数：x1 y1 x2 y2 持续时间ms) -> 等待
+# 结束应用：用 am force-stop 结束进程，保证之前的操作不影响后面
+# 锁屏：电源键锁定屏幕
+PRE_TASK_CMDS="input keyevent 224; sleep 2; input swipe 500 1500 500 500 300; sleep 2; am force-stop $APP_PACKAGE"
+POST_TASK_CMDS="am force-stop $APP_PACKAGE; input keyevent 223"
+
+run_device_cmds() {
+    "$ADB_EXEC" shell "$1"
+}
+
 # 进入项目目录
 cd "$PROJECT_DIR" || exit
 
@@ -34,15 +48,8 @@ else
     exit 1
 fi
 
-# 1. 唤醒手机 (防止黑屏无法操作)
-# 模拟按下电源键唤醒
-"$ADB_EXEC" shell input keyevent 224
-sleep 2
-# 模拟上滑解锁 (参数：x1 y1 x2 y2 持续时间ms)
-"$ADB_EXEC" shell input swipe 500 1500 500 500 300
-sleep 2
-# 先用 adb 结束米游社进程，保证之前的操作不影响后面
-"$ADB_EXEC" shell am force-stop com.mihoyo.hyperion
+# 1. 唤醒手机 (防止黑屏无法操作)，并结束米游社进程
+run_device_cmds "$PRE_TASK_CMDS"
 
 
 # 2. 执行 AutoGLM
@@ -64,10 +71,7 @@ sleep 2
     " \
     >> run.log 2>&1
 
-# 再次用 adb 结束米游社进程
-"$ADB_EXEC" shell am force-stop com.mihoyo.hyperion
-
-# adb 锁定屏幕
-"$ADB_EXEC" shell input keyevent 223
+# 3. 再次结束米游社进程，并锁定屏幕
+run_device_cmds "$POST_TASK_CMDS"
 
 echo "[$(date)] 任务结束" >> run.log
\ No newline at end of file
@@ -42,6 +42,24 @@ class ActionHandler:
         self.confirmation_callback = confirmation_callback or self._default_confirmation
         self.takeover_callback = takeover_callback or self._default_takeover
 
+        # Dispatch table built once instead of on every action
+        self._handlers: dict[str, Callable] = {
+            "Launch": self._handle_launch,
+            "Tap": self._handle_tap,
+            "Type": self._handle_type,
+            "Type_Name": self._handle_type,
+            "Swipe": self._handle_swipe,
+            "Back": self._handle_back,
+            "Home": self._handle_home,
+            "Double Tap": self._handle_double_tap,
+            "Long Press": self._handle_long_press,
+            "Wait": self._handle_wait,
+            "Take_over": self._handle_takeover,
+            "Note": self._handle_note,
+            "Call_API": self._handle_call_api,
+            "Interact": self._handle_interact,
+        }
+
     def execute(
         self, action: dict[str, Any], screen_width: int, screen_height: int
     ) -> ActionResult:
@@ -89,23 +107,7 @@ class ActionHandler:
 
     def _get_handler(self, action_name: str) -> Callable | None:
         """Get the handler method for an action."""
-        handlers = {
-            "Launch": self._handle_launch,
-            "Tap": self._handle_tap,
-            "Type": self._handle_type,
-            "Type_Name": self._handle_type,
-            "Swipe": self._handle_swipe,
-            "Back": self._handle_back,
-            "Home": self._handle_home,
-            "Double Tap": self._handle_double_tap,
-            "Long Press": self._handle_long_press,
-            "Wait": self._handle_wait,
-            "Take_over": self._handle_takeover,
-            "Note": self._handle_note,
-            "Call_API": self._handle_call_api,
-            "Interact": self._handle_interact,
-        }
-        return handlers.get(action_name)
+        return self._handlers.get(action_name)
 
     def _convert_relative_to_absolute(
         self, element: list[int], screen_width: int, screen_height: int
@@ -158,17 +160,18 @@ class ActionHandler:
         original_ime = device_factory.detect_and_set_adb_keyboard(self.device_id)
         time.sleep(TIMING_CONFIG.action.keyboard_switch_delay)
 
-        # Clear existing text and type new text
-        device_factory.clear_text(self.device_id)
-        time.sleep(TIMING_CONFIG.action.text_clear_delay)
-
-        # Handle multiline text by splitting on newlines
-        device_factory.type_text(text, self.device_id)
-        time.sleep(TIMING_CONFIG.action.text_input_delay)
-
-        # Restore original keyboard
-        device_factory.restore_keyboard(original_ime, self.device_id)
-        time.sleep(TIMING_CONFIG.action.keyboard_restore_delay)
+        try:
+            # Clear existing text and type new text
+            device_factory.clear_text(self.device_id)
+            time.sleep(TIMING_CONFIG.action.text_clear_delay)
+
+            # Handle multiline text by splitting on newlines
+            device_factory.type_text(text, self.device_id)
+            time.sleep(TIMING_CONFIG.action.text_input_delay)
+        finally:
+            # Restore original keyboard, even if typing failed or timed out
+            device_factory.restore_keyboard(original_ime, self.device_id)
+            time.sleep(TIMING_CONFIG.action.keyboard_restore_delay)
 
         return ActionResult(True, False)
 
@@ -329,6 +332,10 @@ class ActionHandler:
         input(f"{message}\nPress Enter after completing manual operation...")
 
 
+# Text-input actions whose text may contain characters that break AST parsing
+_TYPE_ACTION_PREFIXES = ('do(action="Type"', 'do(action="Type_Name"')
+
+
 def parse_action(response: str) -> dict[str, Any]:
     """
     Parse action from model response.
@@ -348,9 +355,7 @@ def parse_action(response: str) -> dict[str, Any]:
         # Remove trailing </answer> tag if present
         if response.endswith("</answer>"):
             response = response[:-len("</answer>")].strip()
-        if response.startswith('do(action="Type"') or response.startswith(
-            'do(action="Type_Name"'
-        ):
+        if response.startswith(_TYPE_ACTION_PREFIXES):
             text = response.split("text=", 1)[1][1:-2]
             action = {"_metadata": "do", "action": "Type", "text": text}
             return action
@@ -24,6 +24,7 @@ from phone_agent.adb.input import (
     type_text,
 )
 from phone_agent.adb.screenshot import get_screenshot
+from phone_agent.adb.shell import ADBShell, ADBShellError, close_shells, get_shell
 
 __all__ = [
     # Screenshot
@@ -48,4 +49,9 @@ __all__ = [
     "ConnectionType",
     "quick_connect",
     "list_devices",
+    # Shell sessions
+    "ADBShell",
+    "ADBShellError",
+    "get_shell",
+    "close_shells",
 ]
@@ -4,11 +4,25 @@ import subprocess
 import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from phone_agent.config.timing import TIMING_CONFIG
 
 
+@lru_cache(maxsize=8)
+def _adb_base(device_id: str | None) -> tuple[str, ...]:
+    """Get the immutable ADB command prefix for a device."""
+    if device_id:
+        return ("adb", "-s", device_id)
+    return ("adb",)
+
+
+def _get_adb_prefix(device_id: str | None) -> list:
+    """Get ADB command prefix with optional device specifier."""
+    return list(_adb_base(device_id))
+
+
 class ConnectionType(Enum):
     """Type of ADB connection."""
 
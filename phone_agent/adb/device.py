@@ -1,10 +1,13 @@
 """Device control utilities for Android automation."""
 
 import os
+import shlex
 import subprocess
 import time
 from typing import List, Optional, Tuple
 
+from phone_agent.adb.connection import _get_adb_prefix
+from phone_agent.adb.shell import ADBShellError, get_shell
 from phone_agent.config.apps import APP_PACKAGES
 from phone_agent.config.timing import TIMING_CONFIG
 
@@ -19,14 +22,14 @@ def get_current_app(device_id: str | None = None) -> str:
     Returns:
         The app name if recognized, otherwise "System Home".
     """
-    adb_prefix = _get_adb_prefix(device_id)
+    cmd = _get_adb_prefix(device_id) + ["shell", "dumpsys", "window"]
 
     # Retry mechanism for flaky ADB connections
     max_retries = 3
     for attempt in range(max_retries):
         try:
             result = subprocess.run(
-                adb_prefix + ["shell", "dumpsys", "window"],
+                cmd,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -43,7 +46,7 @@ def get_current_app(device_id: str | None = None) -> str:
                 raise ValueError(f"ADB command failed: {error_msg}")
             
             output = result.stdout
-            if not output or len(output.strip()) == 0:
+            if not output or output.isspace():
                 if attempt < max_retries - 1:
                     time.sleep(0.5)  # Brief delay before retry
                     continue
@@ -93,11 +96,7 @@ def tap(
     if delay is None:
         delay = TIMING_CONFIG.device.default_tap_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    _run_shell(device_id, ["input", "tap", str(x), str(y)])
     time.sleep(delay)
 
 
@@ -116,15 +115,9 @@ def double_tap(
     if delay is None:
         delay = TIMING_CONFIG.device.default_double_tap_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    _run_shell(device_id, ["input", "tap", str(x), str(y)])
     time.sleep(TIMING_CONFIG.device.double_tap_interval)
-    subprocess.run(
-        adb_prefix + ["shell", "input", "tap", str(x), str(y)], capture_output=True
-    )
+    _run_shell(device_id, ["input", "tap", str(x), str(y)])
     time.sleep(delay)
 
 
@@ -148,12 +141,9 @@ def long_press(
     if delay is None:
         delay = TIMING_CONFIG.device.default_long_press_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix
-        + ["shell", "input", "swipe", str(x), str(y), str(x), str(y), str(duration_ms)],
-        capture_output=True,
+    _run_shell(
+        device_id,
+        ["input", "swipe", str(x), str(y), str(x), str(y), str(duration_ms)],
     )
     time.sleep(delay)
 
@@ -182,18 +172,15 @@ def swipe(
     if delay is None:
         delay = TIMING_CONFIG.device.default_swipe_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
     if duration_ms is None:
         # Calculate duration based on distance
         dist_sq = (start_x - end_x) ** 2 + (start_y - end_y) ** 2
         duration_ms = int(dist_sq / 1000)
         duration_ms = max(1000, min(duration_ms, 2000))  # Clamp between 1000-2000ms
 
-    subprocess.run(
-        adb_prefix
-        + [
-            "shell",
+    _run_shell(
+        device_id,
+        [
             "input",
             "swipe",
             str(start_x),
@@ -202,7 +189,6 @@ def swipe(
             str(end_y),
             str(duration_ms),
         ],
-        capture_output=True,
     )
     time.sleep(delay)
 
@@ -218,11 +204,7 @@ def back(device_id: str | None = None, delay: float | None = None) -> None:
     if delay is None:
         delay = TIMING_CONFIG.device.default_back_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "keyevent", "4"], capture_output=True
-    )
+    _run_shell(device_id, ["input", "keyevent", "4"])
     time.sleep(delay)
 
 
@@ -237,11 +219,7 @@ def home(device_id: str | None = None, delay: float | None = None) -> None:
     if delay is None:
         delay = TIMING_CONFIG.device.default_home_delay
 
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "input", "keyevent", "KEYCODE_HOME"], capture_output=True
-    )
+    _run_shell(device_id, ["input", "keyevent", "KEYCODE_HOME"])
     time.sleep(delay)
 
 
@@ -265,28 +243,33 @@ def launch_app(
     if app_name not in APP_PACKAGES:
         return False
 
-    adb_prefix = _get_adb_prefix(device_id)
     package = APP_PACKAGES[app_name]
 
-    subprocess.run(
-        adb_prefix
-        + [
-            "shell",
-            "monkey",
-            "-p",
-            package,
-            "-c",
-            "android.intent.category.LAUNCHER",
-            "1",
-        ],
-        capture_output=True,
+    _run_shell(
+        device_id,
+        ["monkey", "-p", package, "-c", "android.intent.category.LAUNCHER", "1"],
     )
     time.sleep(delay)
     return True
 
 
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
+def _run_shell(device_id: str | None, args: list[str]) -> None:
+    """
+    Run a fire-and-forget shell command on the device.
+
+    Uses the persistent shell session for the device and falls back to a
+    one-off ``adb shell`` process only if the session could not be started.
+    A session that fails raises ADBShellError with adb's output and is not
+    retried, since the command may already have run on the device.
+    """
+    try:
+        get_shell(device_id).run(shlex.join(args))
+    except ADBShellError:
+        raise
+    except OSError:
+        subprocess.run(
+            _get_adb_prefix(device_id) + ["shell"] + args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
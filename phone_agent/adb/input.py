@@ -4,6 +4,8 @@ import base64
 import subprocess
 from typing import Optional
 
+from phone_agent.adb.connection import _get_adb_prefix
+
 
 def type_text(text: str, device_id: str | None = None) -> None:
     """
@@ -32,8 +34,9 @@ def type_text(text: str, device_id: str | None = None) -> None:
             "msg",
             encoded_text,
         ],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=10,
     )
 
 
@@ -48,8 +51,9 @@ def clear_text(device_id: str | None = None) -> None:
 
     subprocess.run(
         adb_prefix + ["shell", "am", "broadcast", "-a", "ADB_CLEAR_TEXT"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=10,
     )
 
 
@@ -70,6 +74,7 @@ def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
         adb_prefix + ["shell", "settings", "get", "secure", "default_input_method"],
         capture_output=True,
         text=True,
+        timeout=10,
     )
     current_ime = (result.stdout + result.stderr).strip()
 
@@ -77,8 +82,9 @@ def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
     if "com.android.adbkeyboard/.AdbIME" not in current_ime:
         subprocess.run(
             adb_prefix + ["shell", "ime", "set", "com.android.adbkeyboard/.AdbIME"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
         )
 
     # Warm up the keyboard
@@ -98,12 +104,8 @@ def restore_keyboard(ime: str, device_id: str | None = None) -> None:
     adb_prefix = _get_adb_prefix(device_id)
 
     subprocess.run(
-        adb_prefix + ["shell", "ime", "set", ime], capture_output=True, text=True
+        adb_prefix + ["shell", "ime", "set", ime],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=10,
     )
-
-
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
@@ -11,6 +11,9 @@ from typing import Tuple
 
 from PIL import Image
 
+from phone_agent.adb.connection import _get_adb_prefix
+from phone_agent.screenshot_utils import black_image_base64
+
 
 @dataclass
 class Screenshot:
@@ -62,11 +65,11 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
             timeout=5,
         )
 
-        if not os.path.exists(temp_path):
+        # Read and encode image; a missing file means the pull failed
+        try:
+            img = Image.open(temp_path)
+        except FileNotFoundError:
             return _create_fallback_screenshot(is_sensitive=False)
-
-        # Read and encode image
-        img = Image.open(temp_path)
         width, height = img.size
 
         buffered = BytesIO()
@@ -85,24 +88,12 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
         return _create_fallback_screenshot(is_sensitive=False)
 
 
-def _get_adb_prefix(device_id: str | None) -> list:
-    """Get ADB command prefix with optional device specifier."""
-    if device_id:
-        return ["adb", "-s", device_id]
-    return ["adb"]
-
-
 def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
     """Create a black fallback image when screenshot fails."""
     default_width, default_height = 1080, 2400
 
-    black_img = Image.new("RGB", (default_width, default_height), color="black")
-    buffered = BytesIO()
-    black_img.save(buffered, format="PNG")
-    base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
     return Screenshot(
-        base64_data=base64_data,
+        base64_data=black_image_base64(default_width, default_height),
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,
@@ -0,0 +1,215 @@
+"""Persistent ADB shell sessions for low-latency command dispatch."""
+
+import atexit
+import collections
+import queue
+import re
+import subprocess
+import threading
+import time
+import uuid
+from typing import NoReturn
+
+from phone_agent.adb.connection import _get_adb_prefix
+
+
+class ADBShellError(OSError):
+    """Raised when the shell session fails, with its last output as the cause."""
+
+
+class ADBShell:
+    """
+    A long-lived ``adb shell`` process that commands are written to.
+
+    Spawning a fresh ``adb`` process per command pays process startup and a
+    connection handshake every time. Keeping one shell open per device turns
+    each command into a single write to the shell's stdin.
+
+    Example:
+        >>> shell = get_shell("emulator-5554")
+        >>> shell.run("input keyevent 224")
+        0
+    """
+
+    def __init__(self, device_id: str | None = None):
+        """
+        Initialize the shell session. The process is started lazily.
+
+        Args:
+            device_id: Optional ADB device ID for multi-device setups.
+        """
+        self.device_id = device_id
+        self._process: subprocess.Popen | None = None
+        self._lines: queue.Queue | None = None
+        self._reader: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def run(self, command: str, timeout: float | None = 10) -> int:
+        """
+        Run a command in the shell and wait for it to complete.
+
+        Args:
+            command: Shell command line to execute on the device.
+            timeout: Timeout in seconds to wait for completion. None waits forever.
+
+        Returns:
+            The exit status of the command.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time.
+            ADBShellError: If the session exits or fails. The command may
+                already have run on the device.
+            OSError: If the shell process cannot be started, so the command
+                was not sent.
+        """
+        with self._lock:
+            # A per-call marker on its own line, so command output can never
+            # be mistaken for the end of this command or a later one
+            marker = uuid.uuid4().hex
+            end_pattern = re.compile(rf"^{marker}(\d+)$")
+            payload = f"{command}; rc=$?; echo; echo {marker}$rc\n".encode("utf-8")
+
+            # Last lines of output, so a failure can report adb's reason
+            output: collections.deque[str] = collections.deque(maxlen=5)
+
+            while True:
+                fresh = self._process is None or self._process.poll() is not None
+                if fresh:
+                    self._close()
+                    self._start()
+                try:
+                    self._process.stdin.write(payload)
+                    self._process.stdin.flush()
+                    break
+                except OSError:
+                    # A new process that cannot take input has already exited,
+                    # e.g. because no device is connected
+                    if fresh:
+                        self._fail(
+                            "adb shell exited before running the command", output
+                        )
+                    # A reused session has gone stale; retry on a new one
+                    self._close()
+
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    line = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    # Output of the timed-out command would corrupt later reads
+                    self._close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+
+                if line is None:
+                    self._fail("adb shell session ended unexpectedly", output)
+
+                line = line.rstrip("\r\n")
+                if line.startswith(marker):
+                    match = end_pattern.match(line)
+                    if match is None:
+                        self._fail(f"Malformed end marker: {line!r}", output)
+                    return int(match.group(1))
+                output.append(line)
+
+    def close(self) -> None:
+        """Terminate the shell process."""
+        with self._lock:
+            self._close()
+
+    def _fail(self, message: str, output: collections.deque[str]) -> NoReturn:
+        """Close the session and raise ADBShellError with its last output."""
+        lines = self._lines
+        self._close()
+
+        # Once the reader has finished, the queue holds everything the
+        # process wrote, including errors printed before it exited
+        while True:
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                break
+            if line is None:
+                break
+            output.append(line.rstrip("\r\n"))
+
+        details = "; ".join(line for line in output if line)
+        raise ADBShellError(f"{message}: {details}" if details else message)
+
+    def _start(self) -> None:
+        """Start the shell process and its output reader thread."""
+        self._process = subprocess.Popen(
+            _get_adb_prefix(self.device_id) + ["shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(
+            target=_read_lines,
+            args=(self._process.stdout, self._lines),
+            daemon=True,
+        )
+        self._reader.start()
+
+    def _close(self) -> None:
+        """Terminate the shell process without taking the lock."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        # The reader sees EOF once the process is gone; close stdout after it
+        # finishes so the pipe is not left for the garbage collector
+        self._reader.join(timeout=1)
+        if not self._reader.is_alive():
+            self._process.stdout.close()
+        self._process = None
+        self._lines = None
+        self._reader = None
+
+
+def _read_lines(stream, lines: queue.Queue) -> None:
+    """Forward decoded output lines to a queue, ending with None at EOF."""
+    for raw in iter(stream.readline, b""):
+        lines.put(raw.decode("utf-8", errors="replace"))
+    lines.put(None)
+
+
+_shells: dict[str | None, ADBShell] = {}
+_shells_lock = threading.Lock()
+
+
+def get_shell(device_id: str | None = None) -> ADBShell:
+    """
+    Get the shared shell session for a device, creating it if needed.
+
+    Args:
+        device_id: Optional ADB device ID for multi-device setups.
+
+    Returns:
+        The ADBShell instance for the device.
+    """
+    with _shells_lock:
+        shell = _shells.get(device_id)
+        if shell is None:
+            shell = _shells[device_id] = ADBShell(device_id)
+        return shell
+
+
+def close_shells() -> None:
+    """Terminate all shared shell sessions."""
+    with _shells_lock:
+        shells = list(_shells.values())
+        _shells.clear()
+    for shell in shells:
+        shell.close()
+
+
+atexit.register(close_shells)
@@ -138,6 +138,7 @@ class PhoneAgent:
     ) -> StepResult:
         """Execute a single step of the agent loop."""
         self._step_count += 1
+        msgs = get_messages(self.agent_config.lang)
 
         # Capture current screen state
         device_factory = get_device_factory()
@@ -170,7 +171,6 @@ class PhoneAgent:
 
         # Get model response
         try:
-            msgs = get_messages(self.agent_config.lang)
             print("\n" + "=" * 50)
             print(f"💭 {msgs['thinking']}:")
             print("-" * 50)
@@ -227,7 +227,6 @@ class PhoneAgent:
         finished = action.get("_metadata") == "finish" or result.should_finish
 
         if finished and self.agent_config.verbose:
-            msgs = get_messages(self.agent_config.lang)
             print("\n" + "🎉 " + "=" * 48)
             print(
                 f"✅ {msgs['task_completed']}: {result.message or action.get('message', msgs['done'])}"
@@ -156,6 +156,7 @@ class IOSPhoneAgent:
     ) -> StepResult:
         """Execute a single step of the agent loop."""
         self._step_count += 1
+        msgs = get_messages(self.agent_config.lang)
 
         # Capture current screen state
         screenshot = get_screenshot(
@@ -215,7 +216,6 @@ class IOSPhoneAgent:
 
         if self.agent_config.verbose:
             # Print thinking process
-            msgs = get_messages(self.agent_config.lang)
             print("\n" + "=" * 50)
             print(f"💭 {msgs['thinking']}:")
             print("-" * 50)
@@ -251,7 +251,6 @@ class IOSPhoneAgent:
         finished = action.get("_metadata") == "finish" or result.should_finish
 
         if finished and self.agent_config.verbose:
-            msgs = get_messages(self.agent_config.lang)
             print("\n" + "🎉 " + "=" * 48)
             print(
                 f"✅ {msgs['task_completed']}: {result.message or action.get('message', msgs['done'])}"
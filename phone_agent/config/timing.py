@@ -5,7 +5,20 @@ Users can customize these values by modifying this file or by setting environmen
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+
+
+def _env_field(default: float, env_var: str) -> float:
+    """Declare a timing field that can be overridden by an environment variable."""
+    return field(default=default, metadata={"env": env_var})
+
+
+def _load_env_overrides(config) -> None:
+    """Override every env-backed field of a timing config from the environment."""
+    for f in fields(config):
+        env_var = f.metadata.get("env")
+        if env_var is not None:
+            setattr(config, f.name, float(os.getenv(env_var, getattr(config, f.name))))
 
 
 @dataclass
@@ -13,25 +26,20 @@ class ActionTimingConfig:
     """Configuration for action handler timing delays."""
 
     # Text input related delays (in seconds)
-    keyboard_switch_delay: float = 1.0  # Delay after switching to ADB keyboard
-    text_clear_delay: float = 1.0  # Delay after clearing text
-    text_input_delay: float = 1.0  # Delay after typing text
-    keyboard_restore_delay: float = 1.0  # Delay after restoring original keyboard
+    # Delay after switching to ADB keyboard
+    keyboard_switch_delay: float = _env_field(1.0, "PHONE_AGENT_KEYBOARD_SWITCH_DELAY")
+    # Delay after clearing text
+    text_clear_delay: float = _env_field(1.0, "PHONE_AGENT_TEXT_CLEAR_DELAY")
+    # Delay after typing text
+    text_input_delay: float = _env_field(1.0, "PHONE_AGENT_TEXT_INPUT_DELAY")
+    # Delay after restoring original keyboard
+    keyboard_restore_delay: float = _env_field(
+        1.0, "PHONE_AGENT_KEYBOARD_RESTORE_DELAY"
+    )
 
     def __post_init__(self):
         """Load values from environment variables if present."""
-        self.keyboard_switch_delay = float(
-            os.getenv("PHONE_AGENT_KEYBOARD_SWITCH_DELAY", self.keyboard_switch_delay)
-        )
-        self.text_clear_delay = float(
-            os.getenv("PHONE_AGENT_TEXT_CLEAR_DELAY", self.text_clear_delay)
-        )
-        self.text_input_delay = float(
-            os.getenv("PHONE_AGENT_TEXT_INPUT_DELAY", self.text_input_delay)
-        )
-        self.keyboard_restore_delay = float(
-            os.getenv("PHONE_AGENT_KEYBOARD_RESTORE_DELAY", self.keyboard_restore_delay)
-        )
+        _load_env_overrides(self)
 
 
 @dataclass
@@ -39,41 +47,26 @@ class DeviceTimingConfig:
     """Configuration for device operation timing delays."""
 
     # Default delays for various device operations (in seconds)
-    default_tap_delay: float = 1.0  # Default delay after tap
-    default_double_tap_delay: float = 1.0  # Default delay after double tap
-    double_tap_interval: float = 0.1  # Interval between two taps in double tap
-    default_long_press_delay: float = 1.0  # Default delay after long press
-    default_swipe_delay: float = 1.0  # Default delay after swipe
-    default_back_delay: float = 1.0  # Default delay after back button
-    default_home_delay: float = 1.0  # Default delay after home button
-    default_launch_delay: float = 1.0  # Default delay after launching app
+    # Default delay after tap
+    default_tap_delay: float = _env_field(1.0, "PHONE_AGENT_TAP_DELAY")
+    # Default delay after double tap
+    default_double_tap_delay: float = _env_field(1.0, "PHONE_AGENT_DOUBLE_TAP_DELAY")
+    # Interval between two taps in double tap
+    double_tap_interval: float = _env_field(0.1, "PHONE_AGENT_DOUBLE_TAP_INTERVAL")
+    # Default delay after long press
+    default_long_press_delay: float = _env_field(1.0, "PHONE_AGENT_LONG_PRESS_DELAY")
+    # Default delay after swipe
+    default_swipe_delay: float = _env_field(1.0, "PHONE_AGENT_SWIPE_DELAY")
+    # Default delay after back button
+    default_back_delay: float = _env_field(1.0, "PHONE_AGENT_BACK_DELAY")
+    # Default delay after home button
+    default_home_delay: float = _env_field(1.0, "PHONE_AGENT_HOME_DELAY")
+    # Default delay after launching app
+    default_launch_delay: float = _env_field(1.0, "PHONE_AGENT_LAUNCH_DELAY")
 
     def __post_init__(self):
         """Load values from environment variables if present."""
-        self.default_tap_delay = float(
-            os.getenv("PHONE_AGENT_TAP_DELAY", self.default_tap_delay)
-        )
-        self.default_double_tap_delay = float(
-            os.getenv("PHONE_AGENT_DOUBLE_TAP_DELAY", self.default_double_tap_delay)
-        )
-        self.double_tap_interval = float(
-            os.getenv("PHONE_AGENT_DOUBLE_TAP_INTERVAL", self.double_tap_interval)
-        )
-        self.default_long_press_delay = float(
-            os.getenv("PHONE_AGENT_LONG_PRESS_DELAY", self.default_long_press_delay)
-        )
-        self.default_swipe_delay = float(
-            os.getenv("PHONE_AGENT_SWIPE_DELAY", self.default_swipe_delay)
-        )
-        self.default_back_delay = float(
-            os.getenv("PHONE_AGENT_BACK_DELAY", self.default_back_delay)
-        )
-        self.default_home_delay = float(
-            os.getenv("PHONE_AGENT_HOME_DELAY", self.default_home_delay)
-        )
-        self.default_launch_delay = float(
-            os.getenv("PHONE_AGENT_LAUNCH_DELAY", self.default_launch_delay)
-        )
+        _load_env_overrides(self)
 
 
 @dataclass
@@ -81,19 +74,14 @@ class ConnectionTimingConfig:
     """Configuration for ADB connection timing delays."""
 
     # ADB server and connection delays (in seconds)
-    adb_restart_delay: float = 2.0  # Wait time after enabling TCP/IP mode
-    server_restart_delay: float = (
-        1.0  # Wait time between killing and starting ADB server
-    )
+    # Wait time after enabling TCP/IP mode
+    adb_restart_delay: float = _env_field(2.0, "PHONE_AGENT_ADB_RESTART_DELAY")
+    # Wait time between killing and starting ADB server
+    server_restart_delay: float = _env_field(1.0, "PHONE_AGENT_SERVER_RESTART_DELAY")
 
     def __post_init__(self):
         """Load values from environment variables if present."""
-        self.adb_restart_delay = float(
-            os.getenv("PHONE_AGENT_ADB_RESTART_DELAY", self.adb_restart_delay)
-        )
-        self.server_restart_delay = float(
-            os.getenv("PHONE_AGENT_SERVER_RESTART_DELAY", self.server_restart_delay)
-        )
+        _load_env_overrides(self)
 
 
 @dataclass
@@ -11,6 +11,7 @@ from typing import Tuple
 
 from PIL import Image
 from phone_agent.hdc.connection import _run_hdc_command
+from phone_agent.screenshot_utils import black_image_base64
 
 
 @dataclass
@@ -77,12 +78,13 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
             timeout=5,
         )
 
-        if not os.path.exists(temp_path):
-            return _create_fallback_screenshot(is_sensitive=False)
-
         # Read JPEG image and convert to PNG for model inference
-        # PIL automatically detects the image format from file content
-        img = Image.open(temp_path)
+        # PIL automatically detects the image format from file content;
+        # a missing file means the pull failed
+        try:
+            img = Image.open(temp_path)
+        except FileNotFoundError:
+            return _create_fallback_screenshot(is_sensitive=False)
         width, height = img.size
 
         buffered = BytesIO()
@@ -112,13 +114,8 @@ def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
     """Create a black fallback image when screenshot fails."""
     default_width, default_height = 1080, 2400
 
-    black_img = Image.new("RGB", (default_width, default_height), color="black")
-    buffered = BytesIO()
-    black_img.save(buffered, format="PNG")
-    base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
     return Screenshot(
-        base64_data=base64_data,
+        base64_data=black_image_base64(default_width, default_height),
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,
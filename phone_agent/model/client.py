@@ -7,7 +7,15 @@ from typing import Any
 
 from openai import OpenAI
 
-from phone_agent.config.i18n import get_message
+from phone_agent.config.i18n import get_messages
+
+# Markers that separate the thinking part of a response from the action
+_ACTION_MARKERS = ("finish(message=", "do(action=")
+
+# Every proper prefix of every marker, for one str.endswith() check per chunk
+_ACTION_MARKER_PREFIXES = tuple(
+    marker[:i] for marker in _ACTION_MARKERS for i in range(1, len(marker))
+)
 
 
 @dataclass
@@ -64,7 +72,7 @@ class ModelClient:
             ValueError: If the response cannot be parsed.
         """
         # Start timing
-        start_time = time.time()
+        start_time = time.monotonic()
         time_to_first_token = None
         time_to_thinking_end = None
 
@@ -79,9 +87,8 @@ class ModelClient:
             stream=True,
         )
 
-        raw_content = ""
+        raw_parts: list[str] = []  # Joined once after streaming to avoid O(n^2) concat
         buffer = ""  # Buffer to hold content that might be part of a marker
-        action_markers = ["finish(message=", "do(action="]
         in_action_phase = False  # Track if we've entered the action phase
         first_token_received = False
 
@@ -90,11 +97,11 @@ class ModelClient:
                 continue
             if chunk.choices[0].delta.content is not None:
                 content = chunk.choices[0].delta.content
-                raw_content += content
+                raw_parts.append(content)
 
                 # Record time to first token
                 if not first_token_received:
-                    time_to_first_token = time.time() - start_time
+                    time_to_first_token = time.monotonic() - start_time
                     first_token_received = True
 
                 if in_action_phase:
@@ -105,7 +112,7 @@ class ModelClient:
 
                 # Check if any marker is fully present in buffer
                 marker_found = False
-                for marker in action_markers:
+                for marker in _ACTION_MARKERS:
                     if marker in buffer:
                         # Marker found, print everything before it
                         thinking_part = buffer.split(marker, 1)[0]
@@ -116,7 +123,7 @@ class ModelClient:
 
                         # Record time to thinking end
                         if time_to_thinking_end is None:
-                            time_to_thinking_end = time.time() - start_time
+                            time_to_thinking_end = time.monotonic() - start_time
 
                         break
 
@@ -125,43 +132,29 @@ class ModelClient:
 
                 # Check if buffer ends with a prefix of any marker
                 # If so, don't print yet (wait for more content)
-                is_potential_marker = False
-                for marker in action_markers:
-                    for i in range(1, len(marker)):
-                        if buffer.endswith(marker[:i]):
-                            is_potential_marker = True
-                            break
-                    if is_potential_marker:
-                        break
-
-                if not is_potential_marker:
+                if not buffer.endswith(_ACTION_MARKER_PREFIXES):
                     # Safe to print the buffer
                     print(buffer, end="", flush=True)
                     buffer = ""
 
         # Calculate total time
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
+        raw_content = "".join(raw_parts)
 
         # Parse thinking and action from response
         thinking, action = self._parse_response(raw_content)
 
         # Print performance metrics
-        lang = self.config.lang
+        msgs = get_messages(self.config.lang)
         print()
         print("=" * 50)
-        print(f"⏱️  {get_message('performance_metrics', lang)}:")
+        print(f"⏱️  {msgs['performance_metrics']}:")
         print("-" * 50)
         if time_to_first_token is not None:
-            print(
-                f"{get_message('time_to_first_token', lang)}: {time_to_first_token:.3f}s"
-            )
+            print(f"{msgs['time_to_first_token']}: {time_to_first_token:.3f}s")
         if time_to_thinking_end is not None:
-            print(
-                f"{get_message('time_to_thinking_end', lang)}:        {time_to_thinking_end:.3f}s"
-            )
-        print(
-            f"{get_message('total_inference_time', lang)}:          {total_time:.3f}s"
-        )
+            print(f"{msgs['time_to_thinking_end']}:        {time_to_thinking_end:.3f}s")
+        print(f"{msgs['total_inference_time']}:          {total_time:.3f}s")
         print("=" * 50)
 
         return ModelResponse(
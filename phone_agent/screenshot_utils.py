@@ -0,0 +1,28 @@
+"""Screenshot helpers shared by the ADB, HDC and iOS backends."""
+
+import base64
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image
+
+
+@lru_cache(maxsize=4)
+def black_image_base64(width: int, height: int) -> str:
+    """
+    Encode a black PNG of the given size as base64.
+
+    The result is cached since it never changes, so fallback screenshots
+    skip the PNG encode after the first failure.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+
+    Returns:
+        Base64-encoded PNG data.
+    """
+    black_img = Image.new("RGB", (width, height), color="black")
+    buffered = BytesIO()
+    black_img.save(buffered, format="PNG")
+    return base64.b64encode(buffered.getvalue()).decode("utf-8")
@@ -10,6 +10,8 @@ from io import BytesIO
 
 from PIL import Image
 
+from phone_agent.screenshot_utils import black_image_base64
+
 
 @dataclass
 class Screenshot:
@@ -169,13 +171,8 @@ def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
     # Default iPhone screen size (iPhone 14 Pro)
     default_width, default_height = 1179, 2556
 
-    black_img = Image.new("RGB", (default_width, default_height), color="black")
-    buffered = BytesIO()
-    black_img.save(buffered, format="PNG")
-    base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
     return Screenshot(
-        base64_data=base64_data,
+        base64_data=black_image_base64(default_width, default_height),
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,